@@ -6,27 +6,50 @@ from lib.country import Country
 class Coalition:
     """Coalition is a collection of cooperating Country instances.
 
+    The member list is fixed after construction, so the member attributes
+    are gathered into NumPy arrays and the aggregate quantities computed
+    once in __init__; the properties then return the cached values.
+
     Arguments:
         members: list (Country) of countries.
     """
+
+    # Fixed attribute layout, as in Country: coalitions are rebuilt for
+    # every experiment, and slots avoid a per-instance __dict__.
+    __slots__ = ("members", "_powers", "_alphas", "_etas",
+                 "_total_power", "_avg_ideal_G")
+
     def __init__(self, members: List[Country]):
         self.members = members
         assert all(isinstance(country, Country) for country in self.members)
 
+        n_members = len(self.members)
+        self._powers = np.fromiter(
+            (country.power for country in self.members),
+            dtype=np.float64, count=n_members)
+        self._alphas = np.fromiter(
+            (country.ideal_geoengineering_level for country in self.members),
+            dtype=np.float64, count=n_members)
+        self._etas = np.fromiter(
+            (country.weighted_damage for country in self.members),
+            dtype=np.float64, count=n_members)
+
+        self._total_power = self._powers.sum()
+        assert 0. <= self._total_power <= 1.,\
+            "Coalition's total power must be in [0,1]."
+
+        self._avg_ideal_G = float(self._alphas @ self._etas
+                                  / self._etas.sum())
+
     @property
     def total_power(self) -> float:
         """Coalition's total global power share.
 
         Equals the sum of all members' individual powers.
         """
-        power = np.sum([country.power for country in self.members])
-        assert 0. <= power <= 1., "Coalition's total power must be in [0,1]."
-        return power
+        return self._total_power
 
     @property
     def avg_ideal_G(self) -> float:
         """ Eq. (B.9). Coalition's average ideal geoengineering level."""
-        alphas = [country.ideal_geoengineering_level
-                  for country in self.members]
-        etas = [country.weighted_damage for country in self.members]
-        return np.dot(alphas, etas) / np.sum(etas)
+        return self._avg_ideal_G
@@ -1,6 +1,10 @@
 class Country:
     """ Represents an individual player in the model.
 
+    A Country is immutable after construction, so all derived quantities
+    are precomputed once in __init__ and stored as plain attributes. The
+    coalition- and state-level aggregates read these values repeatedly.
+
     Arguments:
         name: Player name ('W', 'T', or 'C' used in the paper).
         base_temp: Preindustrial baseline temperature. T^base in eq. (B.1)
@@ -8,8 +12,24 @@ class Country:
         ideal_temp: Ideal temperature. T^ideal in eq. (B.3).
         m_damage: Marginal damage term. Param. d in eq. (B.3).
         power: Country's share of global power. Param. gamma in eq. (B.6).
+
+    Attributes:
+        climate_change_temp: Eq. (B.1). Current temperature with zero
+            geoengineering deployment.
+        ideal_geoengineering_level: Parameter alpha in eq. (B.4).
+        climate_change_damage: Damages with zero geoengineering
+            deployment. Corresponds to parameter K in eq. (B.3).
+        weighted_damage: Power-weighted marginal damage. Corresponds to
+            parameter eta in eq. (B.7).
     """
 
+    # Fixed attribute layout: many small Country instances are created
+    # per experiment, and slots avoid a per-instance __dict__.
+    __slots__ = ("name", "base_temp", "delta_temp", "ideal_temp",
+                 "m_damage", "power", "climate_change_temp",
+                 "ideal_geoengineering_level", "climate_change_damage",
+                 "weighted_damage", "_damage_cache")
+
     def __init__(self,
                  name: str,
                  base_temp: float,
@@ -29,31 +49,15 @@ class Country:
         self.m_damage = m_damage
         self.power = power
 
-    @property
-    def climate_change_temp(self) -> float:
-        """Eq. (B.1).
-        Current temperature with zero geoengineering deployment.
-        """
-        return self.base_temp + self.delta_temp
+        self.climate_change_temp = base_temp + delta_temp
+        self.ideal_geoengineering_level = self.climate_change_temp - ideal_temp
+        self.climate_change_damage =\
+            m_damage * (self.climate_change_temp-ideal_temp) ** 2
+        self.weighted_damage = power * m_damage
 
-    @property
-    def ideal_geoengineering_level(self) -> float:
-        """Parameter alpha in eq. (B.4)."""
-        return self.climate_change_temp - self.ideal_temp
-
-    @property
-    def climate_change_damage(self) -> float:
-        """ Damages with zero geoengineering deployment.
-        Corresponds to parameter K in eq. (B.3).
-        """
-        return self.m_damage * (self.climate_change_temp-self.ideal_temp) ** 2
-
-    @property
-    def weighted_damage(self) -> float:
-        """Power-weighter marginal damage.
-        Corresponds to parameter eta in eq. (B.7).
-        """
-        return self.power * self.m_damage
+        # G takes only a handful of distinct values (one deployment
+        # level per state), so the damages are memoized per G.
+        self._damage_cache = {}
 
     def damage(self, G: float) -> float:
         """ Climate damages with geoengineering.
@@ -64,10 +68,15 @@ class Country:
         Arguments:
             G: Current global geoengineering deployment.
         """
-        deviation = self.ideal_geoengineering_level - G
-        cc_damage = self.climate_change_damage
+        damage = self._damage_cache.get(G)
+
+        if damage is None:
+            deviation = self.ideal_geoengineering_level - G
+            damage = self.m_damage * deviation ** 2\
+                - self.climate_change_damage
+            self._damage_cache[G] = damage
 
-        return self.m_damage * deviation ** 2 - cc_damage
+        return damage
 
     def payoff(self, G: float) -> float:
         """ Eq. (B.3). Country's payoff function under geoengineering.
@@ -20,10 +20,27 @@ class MDP:
                  transition_probs: pd.DataFrame,
                  discounting: float):
 
+        # discounting == 1 makes the system matrix singular (the rows
+        # of I - P sum to zero for any stochastic P), so no solver can
+        # handle it.
+        assert 0. <= discounting < 1., "Discounting must be in [0, 1)."
+
         self.n_states = n_states
         self.transition_probs = transition_probs
         self.discounting = discounting
 
+        # Coerce the transition matrix to a row-major contiguous float64
+        # array once, so the solvers never touch the pandas machinery.
+        self._P = np.ascontiguousarray(transition_probs, dtype=np.float64)
+
+        # Constants shared by every solve. The system matrix depends
+        # only on the transition probabilities and the discounting, so
+        # it is assembled once here and reused for every right-hand
+        # side.
+        self._eye = np.eye(n_states)
+        self._one_minus_disc = 1. - discounting
+        self._A = discounting * self._P - self._eye
+
     def solve_value_func(self, payoffs: np.ndarray) -> np.ndarray:
         """ Solve the linear system of value functions
         for an individual player.
@@ -32,18 +49,141 @@ class MDP:
             payoffs: A vector of payoffs size n_states for a single country.
         """
 
-        A = np.zeros((self.n_states, self.n_states))
-        b = np.zeros(self.n_states)
-        P = self.transition_probs
-
-        for state in range(self.n_states):
-            for next_state, prob in enumerate(P.iloc[state, :]):
-                A[state][next_state] = self.discounting * prob
-
-        A -= np.eye(self.n_states)
-        b = -(1-self.discounting) * payoffs
+        A = self._A
+        b = -self._one_minus_disc * np.asarray(payoffs, dtype=np.float64)
         x = np.linalg.solve(A, b)
 
-        assert np.allclose(np.dot(A, x), b)
+        if __debug__:
+            assert np.allclose(np.dot(A, x), b)
 
         return x
+
+    def solve_value_funcs(self, payoffs_matrix: np.ndarray) -> np.ndarray:
+        """ Solve the value functions of all players at once.
+
+        The system matrix is identical for every player; only the payoff
+        vector differs. Stacking the payoffs column-wise and solving the
+        resulting multiple right-hand-side system factorizes the matrix
+        once, instead of once per player.
+
+        Arguments:
+            payoffs_matrix: Size (n_states, n_players) matrix of payoffs,
+                            one column per country.
+        """
+
+        A = self._A
+        B = -self._one_minus_disc * np.asarray(payoffs_matrix,
+                                               dtype=np.float64)
+        X = np.linalg.solve(A, B)
+
+        if __debug__:
+            assert np.allclose(np.dot(A, X), B)
+
+        return X
+
+    def solve_value_func_vi(self, payoffs: np.ndarray,
+                            tol: float = 1e-10) -> np.ndarray:
+        """ Solve the value functions for an individual player with
+        value iteration instead of a direct linear solve.
+
+        Since discounting is below one, the Bellman update is a
+        contraction and the iteration converges geometrically. Each step
+        costs only one matrix-vector product, which avoids the cubic
+        cost of factorizing the full linear system if the number of
+        states ever grows large.
+
+        Arguments:
+            payoffs: A vector of payoffs size n_states for a single country.
+            tol: Maximum allowed distance to the exact fixed point.
+        """
+
+        P = self._P
+        payoffs = np.asarray(payoffs, dtype=np.float64)
+
+        gamma = self.discounting
+        r = self._one_minus_disc * payoffs
+
+        # Without discounting the future there is nothing to iterate
+        # on: the fixed point is the static payoff vector itself, and
+        # the stopping rule below would divide by zero.
+        if gamma == 0.:
+            return r
+
+        V = payoffs.copy()
+
+        # Stopping rule guaranteeing that the final iterate lies within
+        # tol of the exact solution of the linear system.
+        threshold = tol * (1-gamma) / (2*gamma)
+
+        while True:
+            V_new = r + gamma * (P @ V)
+            if np.max(np.abs(V_new - V)) < threshold:
+                return V_new
+            V = V_new
+
+    def solve_value_func_avi(self, payoffs: np.ndarray,
+                             tol: float = 1e-10) -> np.ndarray:
+        """ Solve the value functions for an individual player with
+        accelerated (Nesterov momentum) value iteration.
+
+        Like solve_value_func_vi, but each iterate is extrapolated
+        along the direction of the previous Bellman step with momentum
+        weight (k-1)/(k+2). With discounting close to one this cuts the
+        iteration count roughly to the square root of plain value
+        iteration, so it becomes the method of choice if the state
+        space ever grows far beyond the five states of the
+        three-country model.
+
+        Unlike the plain Bellman update, the extrapolated update is not
+        a contraction for every stochastic matrix (cyclic transition
+        structures make it diverge), so any iteration whose residual
+        grows or stops being finite is rolled back and restarted from
+        the last accepted iterate with the momentum reset. Every such
+        restart still performs one contracting Bellman step, which
+        keeps the overall iteration provably convergent.
+
+        Arguments:
+            payoffs: A vector of payoffs size n_states for a single country.
+            tol: Maximum allowed distance to the exact fixed point.
+        """
+
+        P = self._P
+        payoffs = np.asarray(payoffs, dtype=np.float64)
+
+        gamma = self.discounting
+        r = self._one_minus_disc * payoffs
+
+        # Same degenerate case as in plain value iteration.
+        if gamma == 0.:
+            return r
+
+        # Same stopping rule as in plain value iteration: the Bellman
+        # residual bounds the distance of the returned iterate to the
+        # exact fixed point regardless of the extrapolation.
+        threshold = tol * (1-gamma) / (2*gamma)
+
+        V = payoffs.copy()
+        bellman_prev = r + gamma * (P @ V)
+        V = bellman_prev
+        k = 1
+        residual_prev = np.inf
+
+        while True:
+            bellman = r + gamma * (P @ V)
+            residual = np.max(np.abs(bellman - V))
+            if residual < threshold:
+                return bellman
+
+            if np.isfinite(residual) and residual <= residual_prev:
+                momentum = (k - 1.) / (k + 2.)
+                V = bellman + momentum * (bellman - bellman_prev)
+                bellman_prev = bellman
+                residual_prev = residual
+                k += 1
+            else:
+                # The extrapolation overshot: restart from the last
+                # accepted iterate with the momentum reset, so the next
+                # update is a plain (contracting) Bellman step.
+                V = bellman_prev
+                k = 1
+                residual_prev = np.inf
@@ -1,8 +1,10 @@
+import itertools
+import math
 import numpy as np
 import pandas as pd
 import warnings
 from typing import List, Dict
-from lib.utils import get_approval_committee, list_members
+from lib.utils import list_members, Effectivity
 from lib.errors import ApprovalCommitteeError
 
 
@@ -38,11 +40,12 @@ class TransitionProbabilities:
     """
     def __init__(self,
                  df: pd.DataFrame,
-                 effectivity: Dict[tuple, int],
+                 effectivity: Effectivity,
                  players: List[str],
                  states: List[str],
                  protocol: Dict[str, float],
-                 unanimity_required: bool):
+                 unanimity_required: bool,
+                 dtype: np.dtype = np.float64):
 
         self.df = df
         self.effectivity = effectivity
@@ -51,11 +54,135 @@ class TransitionProbabilities:
         self.protocol = protocol
         self.unanimity_required = unanimity_required
 
+        # Working precision of the probability tensors. The hand-edited
+        # strategy tables carry only a few significant digits, so a
+        # larger model can run in float32 to halve memory bandwidth;
+        # float64 remains the default because the equilibrium checks
+        # compare against tight tolerances. The MDP solver upcasts to
+        # float64 at its boundary either way.
+        self.dtype = np.dtype(dtype)
+
         # Notation: Capital P's stand for probability matrices,
         # lowercase p's for scalar probability values.
         self.P = pd.DataFrame(0., index=states, columns=states)
-        self.P_proposals = {}
-        self.P_approvals = {}
+
+        # The proposal and approval probabilities are stored internally
+        # as (n_players, n_states, n_states) arrays indexed by the
+        # integer codes of (proposer, current_state, next_state); the
+        # string-keyed dictionaries of the public API are materialized
+        # lazily through the P_proposals / P_approvals properties.
+        self._Pp = np.zeros((len(players), len(states), len(states)),
+                            dtype=self.dtype)
+        self._Pa = np.zeros((len(players), len(states), len(states)),
+                            dtype=self.dtype)
+        self._P_proposals_dict = None
+        self._P_approvals_dict = None
+
+        # Protocol weights in player order, so the loops index by
+        # integer instead of hashing player names.
+        self._protocol_vec = np.array([protocol[p] for p in players],
+                                      dtype=self.dtype)
+
+        self._build_strategy_arrays()
+
+    @property
+    def P_proposals(self) -> Dict[tuple, float]:
+        """Proposal probabilities keyed by string triplets
+        (proposer, current_state, next_state)."""
+        if self._P_proposals_dict is None:
+            keys = itertools.product(self.players, self.states, self.states)
+            self._P_proposals_dict = dict(zip(keys, self._Pp.ravel()))
+        return self._P_proposals_dict
+
+    @property
+    def P_approvals(self) -> Dict[tuple, float]:
+        """Approval probabilities keyed by string triplets
+        (proposer, current_state, next_state)."""
+        if self._P_approvals_dict is None:
+            keys = itertools.product(self.players, self.states, self.states)
+            self._P_approvals_dict = dict(zip(keys, self._Pa.ravel()))
+        return self._P_approvals_dict
+
+    def _build_strategy_arrays(self):
+        """Extract the strategy table into dense NumPy arrays.
+
+        The transition probability calculations need the strategy table
+        entries for every (proposer, current_state, next_state) triplet.
+        Reading the pandas MultiIndex cells one by one inside the loops
+        is slow, so we collect all proposal probabilities, acceptance
+        probabilities, and effectivity entries into plain arrays in a
+        single pass over the table.
+        """
+        n_players = len(self.players)
+        n_states = len(self.states)
+
+        columns = pd.MultiIndex.from_product(
+            [[f'Proposer {p}' for p in self.players], self.states])
+
+        # proposal[p, c, n]: probability that player p, if chosen as the
+        # proposer, proposes the move from state c to state n. The
+        # 'Proposition' cross-section has one row per current state, and
+        # reindexing aligns its layout with the player and state order.
+        proposals = self.df.xs('Proposition', level=1).droplevel(1)
+        self._proposal_arr = (proposals
+                              .reindex(index=self.states, columns=columns)
+                              .to_numpy()
+                              .reshape(n_states, n_players, n_states)
+                              .transpose(1, 0, 2)
+                              .astype(self.dtype))
+
+        # accept[r, p, c, n]: probability that responder r approves the
+        # move from state c to state n when proposed by player p. The
+        # 'Acceptance' cross-section has one row per (current state,
+        # responder) pair.
+        rows = pd.MultiIndex.from_product([self.states, self.players])
+        acceptances = self.df.xs('Acceptance', level=1)
+        self._accept_arr = (acceptances
+                            .reindex(index=rows, columns=columns)
+                            .to_numpy()
+                            .reshape(n_states, n_players, n_players, n_states)
+                            .transpose(1, 2, 0, 3)
+                            .astype(self.dtype))
+
+        # eff[r, p, c, n]: 1 if responder r belongs to the approval
+        # committee when player p proposes the move from state c to n.
+        # The Effectivity container already holds the dense
+        # (proposer, current_state, next_state, responder) block, so the
+        # array only needs its axes reordered.
+        self._eff_arr = np.ascontiguousarray(
+            self.effectivity.membership.transpose(3, 0, 1, 2))
+
+        # Boolean committee-membership view of the effectivity entries,
+        # and the resulting committee sizes, shared by both transition
+        # kernels.
+        self._eff_mask = self._eff_arr == 1
+        self._committee_sizes = self._eff_mask.sum(axis=0)
+
+        # committees[p][c][n]: integer indices of the approval committee
+        # members for the move from state c to state n proposed by
+        # player p. Derived once from the effectivity array, so the
+        # transition loops need no boolean mask evaluation per cell.
+        self._committees = [
+            [[np.flatnonzero(self._eff_mask[:, i, c, n])
+              for n in range(n_states)]
+             for c in range(n_states)]
+            for i in range(n_players)]
+
+        # member_mask[s, r]: True if player r is a member of the existing
+        # coalition in state s. Parsing the state names once up front
+        # keeps string handling out of the transition loops.
+        self._member_mask = np.zeros((n_states, n_players), dtype=bool)
+        for s, state in enumerate(self.states):
+            members = list_members(state)
+            for r, player in enumerate(self.players):
+                self._member_mask[s, r] = player in members
+
+        # new_member_mask[c, n, r]: True if player r joins a coalition in
+        # the move from state c to state n. The set difference depends
+        # only on the state pair, so it is taken once for all pairs here
+        # rather than inside the transition loops.
+        self._new_member_mask = (self._member_mask[None, :, :]
+                                 & ~self._member_mask[:, None, :])
 
     def get_probabilities(self):
         if self.unanimity_required:
@@ -64,14 +191,19 @@ class TransitionProbabilities:
             return self.transition_probabilities_without_unanimity()
 
     def safety_checks(self):
-        """Check that all computed values are valid probabilities."""
+        """Check that all computed values are valid probabilities.
+
+        The checks run via plain asserts, so running Python with -O
+        strips them from e.g. large parameter sweeps.
+        """
         # All rows in the state transition probability matrix sum up to one.
-        assert np.isclose(self.P.sum(axis=1), 1.).all()
+        P_arr = self.P.to_numpy()
+        assert np.allclose(P_arr.sum(axis=1), 1.)
 
         # All probabilities are in [0, 1].
-        assert (0. <= self.P.values).all() and (self.P.values <= 1.).all()
-        assert all(0. <= val <= 1. for val in self.P_proposals.values())
-        assert all(0. <= val <= 1. for val in self.P_approvals.values())
+        assert ((0. <= P_arr) & (P_arr <= 1.)).all()
+        assert ((0. <= self._Pp) & (self._Pp <= 1.)).all()
+        assert ((0. <= self._Pa) & (self._Pa <= 1.)).all()
 
     def read_proposal_prob(self, proposer: str, current_state: str,
                            next_state: str) -> float:
@@ -94,86 +226,102 @@ class TransitionProbabilities:
     def transition_probabilities_with_unanimity(self):
         """Calculate transition probabilities with a perfectly unanimous
         approval committee.
-        """
-        
-        for proposer in self.players:
-            for current_state in self.states:
-                for next_state in self.states:
-
-                    indx = (proposer, current_state, next_state)
-                    approvers = get_approval_committee(
-                        self.effectivity, self.players, *indx)
-
-                    # Probability that the current proposer proposes
-                    # next_state while in current_state.
-                    p_proposal = self.read_proposal_prob(*indx)
-                    self.P_proposals[indx] = p_proposal
-
-                    # If the approval committee is empty, the state transition
-                    # is impossible. This should not really happen in the
-                    # scenarios considered here. One could add cases where
-                    # some transitions are forbidden.
-                    if len(approvers) == 0:
-                        p_approved = 0.
-                        self.empty_approval_committee_warning(indx)
-
-                    # The probability of a transition being approved equals
-                    # the probability that all approval committee members
-                    # approve unanimously.
-                    elif 1 <= len(approvers) <= 2:
-                        probs = self.read_approval_probs(approvers, *indx)
-                        p_approved = np.prod(probs)
-                        # print(*indx, approvers, probs.values, p_approved)
-                    else:
-                        raise ApprovalCommitteeError(indx)
-
-                    self.P_approvals[indx] = p_approved
-                    p_rejected = 1 - p_approved
-
-                    # Probability that proposer is chosen by the protocol, AND
-                    # proposes the transition current_state -> next_state.
-                    p_proposed = self.protocol[proposer] * p_proposal
 
-                    # If proposed and approved, state changes.
-                    self.P.loc[current_state, next_state] +=\
-                        p_proposed * p_approved
-                    # Otherwise, state remains unchanged.
-                    self.P.loc[current_state, current_state] +=\
-                        p_proposed * p_rejected
+        The probability of a transition being approved equals the
+        probability that all approval committee members approve
+        unanimously. This allows computing all transitions at once:
+        the approval probabilities are products of the acceptance
+        probabilities over the approver axis of the strategy arrays,
+        and the protocol weights fold in with a single contraction.
+        """
 
-        self.safety_checks()
+        committee_mask = self._eff_mask
+        committee_sizes = self._committee_sizes
+
+        # If the approval committee is empty, the state transition
+        # is impossible. This should not really happen in the
+        # scenarios considered here. One could add cases where
+        # some transitions are forbidden.
+        for i, c, n in zip(*np.nonzero(committee_sizes == 0)):
+            self.empty_approval_committee_warning(
+                (self.players[i], self.states[c], self.states[n]))
+
+        if (committee_sizes > 2).any():
+            i, c, n = [axis[0] for axis in np.nonzero(committee_sizes > 2)]
+            raise ApprovalCommitteeError(
+                (self.players[i], self.states[c], self.states[n]))
+
+        # Non-members contribute a factor of one to the unanimity product;
+        # an empty committee means the transition can never be approved.
+        accept = np.where(committee_mask, self._accept_arr, 1.)
+        p_approved = np.where(committee_sizes > 0, accept.prod(axis=0), 0.)
+
+        # Probability that each proposer is chosen by the protocol, AND
+        # proposes the corresponding transition.
+        p_proposed = self._protocol_vec[:, None, None] * self._proposal_arr
+
+        # If proposed and approved, the state changes. Otherwise, the
+        # state remains unchanged, and the rejected probability mass
+        # accumulates on the diagonal.
+        P_arr = np.einsum('pcn,pcn->cn', p_proposed, p_approved)
+        rejected_mass = (p_proposed * (1. - p_approved)).sum(axis=(0, 2))
+        P_arr[np.diag_indices_from(P_arr)] += rejected_mass
+
+        self.P = pd.DataFrame(P_arr, index=self.states, columns=self.states)
+        self._Pp = self._proposal_arr
+        self._Pa = p_approved
+
+        # The probability arrays were just (re)bound, so any previously
+        # materialized dict snapshot is stale and must be rebuilt on the
+        # next P_proposals / P_approvals access.
+        self._P_proposals_dict = None
+        self._P_approvals_dict = None
+
+        if __debug__:
+            self.safety_checks()
         return (self.P, self.P_proposals, self.P_approvals)
 
     def transition_probabilities_without_unanimity(self):
         """Calculate transition probabilities such that the approval is
         required from all new members, but only from the majority of
         existing members.
+
+        The loop body operates purely on the precomputed strategy arrays
+        and boolean membership masks, so no strategy table lookups or
+        state-name parsing happen inside the hot loop.
         """
 
-        for proposer in self.players:
-            for current_state in self.states:
-                for next_state in self.states:
+        # Accumulate the transition probabilities in a plain array and
+        # wrap the result into a labeled DataFrame only once at the end.
+        P_arr = np.zeros((len(self.states), len(self.states)),
+                         dtype=self.dtype)
+
+        for i, proposer in enumerate(self.players):
+            for c, current_state in enumerate(self.states):
+                for n, next_state in enumerate(self.states):
                     indx = (proposer, current_state, next_state)
 
-                    approvers = get_approval_committee(
-                        self.effectivity, self.players, *indx)
+                    committee = self._committees[i][c][n]
+                    acc_vec = self._accept_arr[:, i, c, n]
 
                     # Proposal probability:
                     # ---------------------
 
                     # Probability that proposer proposes next_state while
                     # in current_state.
-                    p_proposal = self.read_proposal_prob(*indx)
-                    self.P_proposals[indx] = p_proposal
+                    p_proposal = self._proposal_arr[i, c, n]
+                    self._Pp[i, c, n] = p_proposal
 
                     # Approval probabilities:
                     # ----------------------
 
+                    n_approvers = committee.size
+
                     # If the approval committee is empty, the state transition
                     # is impossible. This should not really happen in the
                     # scenarios considered here. One could add cases where
                     # some transitions are forbidden.
-                    if len(approvers) == 0:
+                    if n_approvers == 0:
                         p_approved = 0.
                         self.empty_approval_committee_warning(indx)
 
@@ -182,31 +330,26 @@ class TransitionProbabilities:
                     # This covers both maintaining status quo, unilateral
                     # breakout, and cases such as W proposing ( ) -> (WC),
                     # where C is the only one who needs to approve.
-                    elif len(approvers) == 1:
-                        p_approved = self.read_approval_probs(
-                            approvers, *indx).values
-                        # print(*indx, approvers, p_approved)
+                    elif n_approvers == 1:
+                        p_approved = acc_vec[committee[0]]
 
                     # For a larger approval committee, we need to consider
                     # the cases where majority approval committee can
                     # validate state transitions.
                     else:
-                        assert len(approvers) == 2
-                        current_members = list_members(current_state)
-                        next_members = list_members(next_state)
+                        assert n_approvers == 2
+                        current_members = self._member_mask[c]
+                        next_members = self._member_mask[n]
 
-                        new_members = [country for country in next_members
-                                       if country not in current_members]
+                        new_members = self._new_member_mask[c, n]
 
-                        current_non_proposer_members = [
-                            country for country in current_members
-                            if country != proposer]
+                        current_non_proposers = current_members.copy()
+                        current_non_proposers[i] = False
 
-                        new_non_proposer_members = [
-                            country for country in new_members
-                            if country != proposer]
+                        new_non_proposers = new_members.copy()
+                        new_non_proposers[i] = False
 
-                        if new_non_proposer_members:
+                        if new_non_proposers.any():
                             # CASE 1:
                             # If there are new non-proposer members joining
                             # the new coalition, and the proposer is not
@@ -222,14 +365,10 @@ class TransitionProbabilities:
                             # members must approve the transition.
                             # E.g., W proposing (WC) -> (WT) or (WC) -> (WTC)
                             # must be approved by T but not C.
-                            if (proposer not in current_members) or\
-                                (proposer in current_members and
-                                    proposer in next_members):
-                                probs = self.read_approval_probs(
-                                    new_non_proposer_members, *indx)
-                                p_approved = np.prod(probs)
-                                # print(*indx, new_non_proposer_members,
-                                #       probs.values, p_approved)
+                            if not current_members[i] or\
+                                (current_members[i] and next_members[i]):
+                                p_approved = math.prod(
+                                    acc_vec[new_non_proposers].tolist())
 
                             # CASE 2:
                             # If there are new non-proposer members joining
@@ -239,13 +378,9 @@ class TransitionProbabilities:
                             # new coalition must approve the transition.
                             # E.g., W proposing (WC) -> (TC) or (WT) -> (TC)
                             # must be approved by both T and C.
-                            elif (proposer in current_members) and\
-                                 (proposer not in next_members):
-                                probs = self.read_approval_probs(
-                                    next_members, *indx)
-                                p_approved = np.prod(probs)
-                                # print(*indx, next_members, probs.values,
-                                #       p_approved)
+                            elif current_members[i] and not next_members[i]:
+                                p_approved = math.prod(
+                                    acc_vec[next_members].tolist())
                             else:
                                 raise ApprovalCommitteeError(indx)
 
@@ -256,25 +391,29 @@ class TransitionProbabilities:
                         # E.g., W proposing (TC) -> ( ) or (TC) -> (WC)
                         # or (WTC) -> ( ) or (WTC) -> (WC) can be approved by
                         # either T or C, or W proposing (WTC)
-                        elif not new_non_proposer_members:
-                            probs = self.read_approval_probs(
-                                    current_non_proposer_members, *indx)
-                            p_approved = np.sum(probs) - np.prod(probs)
-                            # print(*indx, current_non_proposer_members,
-                            #       probs.values, p_approved)
+                        elif not new_non_proposers.any():
+                            probs = acc_vec[current_non_proposers].tolist()
+                            p_approved = sum(probs) - math.prod(probs)
                         else:
                             raise ApprovalCommitteeError(indx)
 
-                    self.P_approvals[indx] = p_approved
+                    self._Pa[i, c, n] = p_approved
                     p_rejected = 1 - p_approved
 
-                    p_proposed = self.protocol[proposer] * p_proposal
+                    p_proposed = self._protocol_vec[i] * p_proposal
                     # If approved, state changes.
-                    self.P.loc[current_state, next_state] +=\
-                        p_proposed * p_approved
+                    P_arr[c, n] += p_proposed * p_approved
                     # Otherwise, state remains unchanged.
-                    self.P.loc[current_state, current_state] +=\
-                        p_proposed * p_rejected
+                    P_arr[c, c] += p_proposed * p_rejected
+
+        self.P = pd.DataFrame(P_arr, index=self.states, columns=self.states)
+
+        # The probability arrays were just refilled, so any previously
+        # materialized dict snapshot is stale and must be rebuilt on the
+        # next P_proposals / P_approvals access.
+        self._P_proposals_dict = None
+        self._P_approvals_dict = None
 
-        self.safety_checks()
+        if __debug__:
+            self.safety_checks()
         return (self.P, self.P_proposals, self.P_approvals)
@@ -1,3 +1,4 @@
+import functools
 import numpy as np
 from typing import List, Dict
 from lib.country import Country
@@ -30,19 +31,15 @@ class State:
         self.all_countries = all_countries
         self.power_rule = power_rule
         self.min_power = min_power
-        self.coalition_powers = [coal.total_power for coal in self.coalitions]
+        self.coalition_powers = np.fromiter(
+            (coal.total_power for coal in self.coalitions),
+            dtype=np.float64, count=len(self.coalitions))
 
-        assert np.isclose(np.sum(self.coalition_powers), 1., atol=1e-12),\
+        assert abs(self.coalition_powers.sum() - 1.) < 1e-9,\
             "Coalition powers must sum up to 1."
 
-    @property
-    def strongest_coalition(self) -> Coalition:
-        """
-        Returns the coalition that, according to self.power_rule,
-        gets to implement geoengineering.
-
-        Note: we assume that the strongest_coalition is unique.
-        """
+        # Resolve the comparison rule once here, so strongest_coalition
+        # only needs a single max() pass per access.
         if self.power_rule == "power_threshold":
             # Coalition with the highest share of the world power
             # gets to implement geoengineering, if minimum threshold is met.
@@ -56,15 +53,40 @@ class State:
                    "Must be in ['power_threshold', 'weak_governance']")
             raise ValueError(msg)
 
-        sorted_coalitions = sorted(self.coalitions, key=sort_key, reverse=True)
-        strongest_coalition = sorted_coalitions[0]
+        self._sort_key = sort_key
+
+        # Country-level parameters gathered into arrays, so the payoffs
+        # of all countries come out of one vectorized damage evaluation.
+        self._country_names = [country.name for country in all_countries]
+        self._alphas = np.array([country.ideal_geoengineering_level
+                                 for country in all_countries])
+        self._m_damages = np.array([country.m_damage
+                                    for country in all_countries])
+        self._cc_damages = np.array([country.climate_change_damage
+                                     for country in all_countries])
+
+    @functools.cached_property
+    def strongest_coalition(self) -> Coalition:
+        """
+        Returns the coalition that, according to self.power_rule,
+        gets to implement geoengineering.
+
+        Note: we assume that the strongest_coalition is unique.
+
+        The coalition structure is fixed after construction, so the
+        result is cached on first access.
+        """
+        strongest_coalition = max(self.coalitions, key=self._sort_key)
         assert isinstance(strongest_coalition, Coalition)
 
         return strongest_coalition
 
-    @property
+    @functools.cached_property
     def geo_deployment_level(self) -> float:
-        """Geoengineering deployment chosen by the strongest coalition."""
+        """Geoengineering deployment chosen by the strongest coalition.
+
+        Cached on first access, like strongest_coalition.
+        """
         winner_power = self.strongest_coalition.total_power
         G = self.strongest_coalition.avg_ideal_G
 
@@ -83,21 +105,23 @@ class State:
             # considered in this paper.
             else:
                 msg = "Several winning coalitions not allowed"
-                assert self.coalition_powers.count(winner_power) == 1, msg
+                assert (self.coalition_powers == winner_power).sum() == 1, msg
 
                 msg = "Incorrect winner assignment"
-                assert all(i <= winner_power for i in self.coalition_powers),\
-                    msg
+                assert (self.coalition_powers <= winner_power).all(), msg
 
         return G
 
-    @property
+    @functools.cached_property
     def payoffs(self) -> Dict[str, float]:
         """Calculate the payoffs for all countries, given the current
-        coalition structure and corresponding geoengineering deployment."""
+        coalition structure and corresponding geoengineering deployment.
+
+        Cached on first access, like the other derived state values."""
         G = self.geo_deployment_level
 
-        names = [country.name for country in self.all_countries]
-        payoffs = [country.payoff(G) for country in self.all_countries]
+        # Eq. (B.3) evaluated for all countries at once.
+        deviations = self._alphas - G
+        payoffs = -(self._m_damages * deviations ** 2 - self._cc_damages)
 
-        return dict(zip(names, payoffs))
+        return dict(zip(self._country_names, payoffs.tolist()))
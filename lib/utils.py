@@ -1,3 +1,5 @@
+import concurrent.futures
+import functools
 import numpy as np
 import pandas as pd
 from typing import List, Dict, Tuple, Any
@@ -15,15 +17,27 @@ def get_payoff_matrix(states: List[State], columns: List[str]) -> pd.DataFrame:
     assert all(isinstance(state, State) for state in states)
 
     state_names = [state.name for state in states]
-    payoffs_df = pd.DataFrame(index=state_names, columns=columns,
-                              dtype=np.float64)
 
+    # All states share the same underlying countries, so the whole
+    # payoff matrix follows from the per-state deployment levels and
+    # the country parameters in one broadcast evaluation of Eq. (B.3).
+    countries = states[0].all_countries
     for state in states:
-        assert list(state.payoffs.keys()) == columns,\
-            "Payoff matrix cols and payoff dict keys do not match!"
-        payoffs_df.loc[state.name, :] = state.payoffs
+        assert [country.name for country in state.all_countries] == columns,\
+            "Payoff matrix cols and country names do not match!"
 
-    return payoffs_df
+    alphas = np.array([country.ideal_geoengineering_level
+                       for country in countries])
+    m_damages = np.array([country.m_damage for country in countries])
+    cc_damages = np.array([country.climate_change_damage
+                           for country in countries])
+    G = np.fromiter((state.geo_deployment_level for state in states),
+                    dtype=np.float64, count=len(states))
+
+    deviations = alphas[None, :] - G[:, None]
+    data = -(m_damages[None, :] * deviations ** 2 - cc_damages[None, :])
+
+    return pd.DataFrame(data, index=state_names, columns=columns, copy=False)
 
 
 def get_geoengineering_levels(states: List[State]) -> pd.DataFrame:
@@ -35,24 +49,83 @@ def get_geoengineering_levels(states: List[State]) -> pd.DataFrame:
     """
     assert all(isinstance(state, State) for state in states)
 
-    G = {}
-    for state in states:
-        G[state.name] = state.geo_deployment_level
+    # One flat array plus a single DataFrame constructor, instead of
+    # growing a dict and converting it afterwards.
+    G = np.fromiter((state.geo_deployment_level for state in states),
+                    dtype=np.float64, count=len(states))
 
-    return pd.DataFrame.from_dict(G, orient='index', columns=["G"])
+    return pd.DataFrame(G, index=[state.name for state in states],
+                        columns=["G"])
 
 
-def list_members(state: str) -> List[str]:
+@functools.lru_cache(maxsize=None)
+def list_members(state: str) -> Tuple[str, ...]:
     """ Lists all the member countries of the existing coalition.
 
-    For instance, list_current_members('(WTC)') returns ['W', 'T', 'C'].
-    For ( ), returns an empty list.
+    For instance, list_current_members('(WTC)') returns ('W', 'T', 'C').
+    For ( ), returns an empty tuple.
+
+    The states are drawn from a small fixed set of names, so the parsed
+    results are memoized instead of re-scanning the string on each call.
+    The result is a tuple, so every caller shares the one immutable
+    cached value.
     """
-    no_brackets = list(state[state.find("(")+1:state.find(")")])
-    return [char for char in no_brackets if char != " "]
+    no_brackets = state[state.find("(")+1:state.find(")")]
+    return tuple(char for char in no_brackets if char != " ")
 
 
-def get_approval_committee(effectivity: Dict[tuple, int], players: List[str],
+class Effectivity:
+    """ Dense container for the effectivity correspondence.
+
+    Stores the committee membership entries as one contiguous
+    (proposer, current_state, next_state, responder) integer array,
+    while keeping the dict-style interface
+    effectivity[(proposer, current_state, next_state, responder)]
+    that the rest of the code indexes with.
+
+    Arguments:
+        membership: Size (n_players, n_states, n_states, n_players)
+                    array of 0/1 membership entries.
+        players: The list (string) of all countries in the game.
+        states: A list (str) of all the considered states of the system.
+    """
+    def __init__(self, membership: np.ndarray, players: List[str],
+                 states: List[str]):
+
+        self.membership = membership
+        self.players = players
+        self.states = states
+        self._player_to_idx = {player: i for i, player in enumerate(players)}
+        self._state_to_idx = {state: i for i, state in enumerate(states)}
+
+        # The membership block is fixed after construction, so the
+        # approval committees are resolved once per transition triple
+        # here; committee() then returns the prebuilt list instead of
+        # re-scanning a membership row on every call.
+        self._committee_table = {}
+        for i, proposer in enumerate(players):
+            for c, current_state in enumerate(states):
+                for n, next_state in enumerate(states):
+                    members = [players[r] for r
+                               in np.flatnonzero(membership[i, c, n])]
+                    self._committee_table[
+                        (proposer, current_state, next_state)] = members
+
+    def __getitem__(self, key: tuple) -> int:
+        proposer, current_state, next_state, responder = key
+        return int(self.membership[self._player_to_idx[proposer],
+                                   self._state_to_idx[current_state],
+                                   self._state_to_idx[next_state],
+                                   self._player_to_idx[responder]])
+
+    def committee(self, proposer: str, current_state: str,
+                  next_state: str) -> List[str]:
+        """Names of the approval committee members for the transition
+        (current_state) -> (next_state) suggested by proposer."""
+        return self._committee_table[(proposer, current_state, next_state)]
+
+
+def get_approval_committee(effectivity: 'Effectivity', players: List[str],
                            proposer: str, current_state: str,
                            next_state: str) -> List[str]:
     """Returns the list of all players who belong to the approval committee
@@ -66,6 +139,9 @@ def get_approval_committee(effectivity: Dict[tuple, int], players: List[str],
         next_state: The next coalition structure suggested by proposer.
     """
 
+    if isinstance(effectivity, Effectivity):
+        return effectivity.committee(proposer, current_state, next_state)
+
     comm = [player for player in players
             if effectivity[(proposer, current_state, next_state, player)] == 1]
 
@@ -73,7 +149,7 @@ def get_approval_committee(effectivity: Dict[tuple, int], players: List[str],
 
 
 def derive_effectivity(df: pd.DataFrame, players: List[str],
-                       states: List[str]) -> Dict[tuple, int]:
+                       states: List[str]) -> Effectivity:
     """ Defines the effectivity correspondence from the strategy profiles.
 
     For each possible proposer, every possible state transition, and
@@ -92,7 +168,7 @@ def derive_effectivity(df: pd.DataFrame, players: List[str],
         states: A list (str) of all the considered states of the system.
 
     Returns:
-        effectivity: a dictionary with keys being the 4-tuples
+        effectivity: An Effectivity instance indexed by the 4-tuples
                      (proposer, current_state, next_state, responder), and
                      the value being a boolean 0 or 1. Each entry tells
                      whether the responder is a member of the approval
@@ -100,36 +176,49 @@ def derive_effectivity(df: pd.DataFrame, players: List[str],
                      the current_state to next_state.
     """
 
-    effectivity = {}
-
+    # Extract the full 'Acceptance' block of the strategy table in one
+    # pandas call, and reindex it so the cell order is known exactly.
+    # A non-empty acceptance cell means the responder is a member of the
+    # approval committee for that transition.
+    rows = pd.MultiIndex.from_product([states, players])
+    cols = pd.MultiIndex.from_product(
+        [[f'Proposer {proposer}' for proposer in players], states])
+
+    acceptances = df.xs('Acceptance', level=1).reindex(
+        index=rows, columns=cols).to_numpy()
+
+    # Dimensions after the reshape: (current_state, responder,
+    # proposer, next_state); reorder to match the key layout below.
+    membership = (~np.isnan(acceptances)).astype(np.uint8).reshape(
+        len(states), len(players), len(players), len(states)
+        ).transpose(2, 0, 3, 1)
+
+    effectivity = Effectivity(membership, players, states)
+
+    # Trivially, the proposer must approve any transition it suggests,
+    # and is therefore included in the effectivity correspondence.
+    # However, for convenience, we only include the proposer
+    # explicitly in the strategy table when the proposer is the
+    # only approval committee member, and thus can approve
+    # the proposed transition without consulting others.
+
+    # For every possible proposer, it is always possible to
+    # maintain the status quo without the approval of others.
+    # Therefore, for such a transition, check that the current
+    # proposer is the only member in the effectivity
+    # correspondence. One fancy-indexed comparison covers the
+    # (current_state == next_state) diagonal for all proposers
+    # and states at once.
+    s_idx = np.arange(len(states))
+    status_quo = membership[:, s_idx, s_idx, :]
+    assert (status_quo == np.eye(len(players), dtype=int)[:, None, :]).all()
+
+    # Similarly, any country is allowed to walk out of its
+    # existing coalition.
     for proposer in players:
         for current_state in states:
             for next_state in states:
-                for responder in players:
-
-                    # If the corresponding 'acceptance' cell is not empty,
-                    # the player is a member of the approval committee.
-                    resp_val = df.loc[(current_state, 'Acceptance', responder),
-                                      (f'Proposer {proposer}', next_state)]
-                    is_member = int(~np.isnan(resp_val))
-
-                    idx = (proposer, current_state, next_state, responder)
-                    effectivity[idx] = is_member
-
-                # Trivially, the proposer must approve the transition,
-                # and is therefore included in the effectivity correspondence.
-                # However, for convenience, we only include the proposer
-                # explicitly in the strategy table when the proposer is the
-                # only approval committee member, and thus can approve
-                # the proposed transition without consulting others.
-
-                # For every possible proposer, it is always possible to
-                # maintain the status quo without the approval of others.
-                # Therefore, for such a transition, check that the current
-                # proposer is the only member in the effectivity
-                # correspondence. Similarly, any country is allowed to
-                # walk out of its existing coalition.
-                if current_state == next_state or is_unilateral_breakout(
+                if is_unilateral_breakout(
                                     proposer, current_state, next_state):
 
                     committee = get_approval_committee(effectivity, players,
@@ -193,46 +282,49 @@ def verify_proposals(players: List[str], states: List[str],
            players in all states.
     """
 
-    for proposer in players:
-        for current_state in states:
-
-            # All next states for which the proposer attaches
-            # a positive proposition probability while in current_state.
-            pos_prob_next_states = []
-
-            # Expectation of the proposition value:
+    # One dense view of V, so the loop below reads plain ndarray scalars
+    # instead of going through .loc.
+    V_arr = V.to_numpy()
+    n_players = len(players)
+    n_states = len(states)
+
+    # Pack the probability dicts into dense (player, current_state,
+    # next_state) arrays once, so every (proposer, current_state) pair
+    # is then checked with one broadcast expression over next states.
+    P_prop_arr = np.empty((n_players, n_states, n_states))
+    P_app_arr = np.empty((n_players, n_states, n_states))
+
+    for i, proposer in enumerate(players):
+        for c, current_state in enumerate(states):
+            for n, next_state in enumerate(states):
+                idx = (proposer, current_state, next_state)
+                P_prop_arr[i, c, n] = P_proposals[idx]
+                P_app_arr[i, c, n] = P_approvals[idx]
+
+    for i, proposer in enumerate(players):
+        for c, current_state in enumerate(states):
+
+            # Expectation of the proposition value for all next states:
             # E = p_accepted * V_next + p_rejected * V_current
-            expected_values = {}
-
-            for next_state in states:
-
-                p_proposed = P_proposals[(proposer, current_state,
-                                         next_state)]
-
-                if p_proposed > 0.:
-                    pos_prob_next_states.append(next_state)
-
-                # Probability that the approval committee accepts.
-                p_approved = P_approvals[(proposer, current_state,
-                                         next_state)]
-                p_rejected = 1 - p_approved
-
-                V_current = V.loc[current_state, proposer]
-                V_next = V.loc[next_state, proposer]
-                expected_values[next_state] =\
-                    p_approved * V_next + p_rejected * V_current
+            p_approved = P_app_arr[i, c]
+            expected_values = (p_approved * V_arr[:, i]
+                               + (1. - p_approved) * V_arr[c, i])
 
             # Next state(s) that give the highest possible expected
-            # long-run payoff.
-            argmaxes = [key for key, val in expected_values.items()
-                        if np.isclose(val, max(expected_values.values()),
-                        atol=1e-12)]
-
-            try:
-                # Any state with a positive proposal probability must be one
-                # of the best alternatives.
-                assert set(pos_prob_next_states).issubset(argmaxes)
-            except AssertionError:
+            # long-run payoff. The tolerance matches np.isclose with
+            # atol=1e-12 and the default relative tolerance.
+            best_value = expected_values.max()
+            tolerance = 1e-12 + 1e-5 * abs(best_value)
+            best_mask = np.abs(expected_values - best_value) < tolerance
+
+            # Any state with a positive proposal probability must be one
+            # of the best alternatives.
+            pos_mask = P_prop_arr[i, c] > 0.
+
+            if (pos_mask & ~best_mask).any():
+                pos_prob_next_states = [states[n] for n
+                                        in np.flatnonzero(pos_mask)]
+                argmaxes = [states[n] for n in np.flatnonzero(best_mask)]
                 error_msg = (
                          f"Proposal strategy error with player {proposer}! "
                          f"In state {current_state}, positive probability "
@@ -247,7 +339,7 @@ def verify_proposals(players: List[str], states: List[str],
 
 
 def verify_approvals(players: List[str], states: List[str],
-                     effectivity: Dict[tuple, int], V: pd.DataFrame,
+                     effectivity: Effectivity, V: pd.DataFrame,
                      strategy_df: pd.DataFrame) -> Tuple[bool, str]:
     """Checks that the approval strategies of all players constitute a
     valid equilibrium, as specified in Condition 2 in section A.5.
@@ -261,22 +353,42 @@ def verify_approvals(players: List[str], states: List[str],
         strategy_df: A dataframe containing the strategies of all players.
     """
 
-    for proposer in players:
-        for current_state in states:
-            for next_state in states:
+    # Same dense V view as in verify_proposals.
+    V_arr = V.to_numpy()
+    player_to_idx = {player: i for i, player in enumerate(players)}
+
+    # Dense (proposer, current_state, next_state, responder) view of the
+    # acceptance probabilities, extracted with the same bulk pattern as
+    # derive_effectivity. The innermost loop then reads plain strided
+    # scalars instead of hashing through both MultiIndexes per cell.
+    rows = pd.MultiIndex.from_product([states, players])
+    cols = pd.MultiIndex.from_product(
+        [[f'Proposer {p}' for p in players], states])
+    strat_arr = (strategy_df.xs('Acceptance', level=1)
+                 .reindex(index=rows, columns=cols)
+                 .to_numpy()
+                 .reshape(len(states), len(players), len(players), len(states))
+                 .transpose(2, 0, 3, 1))
+
+    for i, proposer in enumerate(players):
+        for c, current_state in enumerate(states):
+            for n, next_state in enumerate(states):
 
                 # Approval committee for this transition.
                 approvers = get_approval_committee(
                     effectivity, players, proposer, current_state, next_state)
 
                 for approver in approvers:
-                    V_current = V.loc[current_state, approver]
-                    V_next = V.loc[next_state, approver]
-                    p_approve = strategy_df.loc[
-                                    (current_state, 'Acceptance', approver),
-                                    (f'Proposer {proposer}', next_state)]
-
-                    if np.isclose(V_next, V_current, atol=1e-12):
+                    r = player_to_idx[approver]
+                    V_current = V_arr[c, r]
+                    V_next = V_arr[n, r]
+                    p_approve = strat_arr[i, c, n, r]
+
+                    # Plain arithmetic comparison matching np.isclose
+                    # with atol=1e-12 and the default relative
+                    # tolerance, without the per-scalar ufunc dispatch.
+                    tolerance = 1e-12 + 1e-5 * abs(V_current)
+                    if abs(V_next - V_current) <= tolerance:
                         passed = (0. <= p_approve <= 1.)
                     elif V_next > V_current:
                         passed = (p_approve == 1.)
@@ -300,12 +412,17 @@ def verify_approvals(players: List[str], states: List[str],
     return True, "Test passed."
 
 
-def verify_equilibrium(result: Dict[str, Any]):
+def verify_equilibrium(result: Dict[str, Any], fail_fast: bool = False):
     """Checks that the experiment results and strategy profiles are a
     valid equilibrium.
 
     Arguments:
         results: A dictionary from main.run_experiment().
+        fail_fast: If True, return as soon as the proposal check fails,
+                   skipping the approval check. Useful when the caller
+                   only needs a boolean, e.g. while iterating on a
+                   candidate strategy table; by default both checks run
+                   so the combined error message covers everything.
     """
 
     proposals_ok = verify_proposals(players=result["players"],
@@ -314,6 +431,9 @@ def verify_equilibrium(result: Dict[str, Any]):
                                     P_approvals=result["P_approvals"],
                                     V=result["V"])
 
+    if fail_fast and not proposals_ok[0]:
+        return False, proposals_ok[1]
+
     approvals_ok = verify_approvals(players=result["players"],
                                     states=result["state_names"],
                                     effectivity=result["effectivity"],
@@ -341,9 +461,18 @@ def write_latex_tables(result: Dict[str, Any], variables: List[str],
         float_format: How many digits to include in the .tex tables.
     """
 
+    if not variables:
+        return
+
     experiment = result['experiment_name']
-    for variable in variables:
 
+    def write_table(variable: str) -> None:
         path = f"{results_path}/{variable}_{experiment}.tex"
         result[variable].to_latex(buf=path, float_format=float_format,
                                   caption=f"{experiment}: {variable}")
+
+    # The tables are independent files, so format and write them
+    # concurrently instead of one open/format/close cycle at a time.
+    n_workers = min(8, len(variables))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=n_workers) as pool:
+        list(pool.map(write_table, variables))
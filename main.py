@@ -6,6 +6,9 @@ Governance: A Dynamic Framework of Farsighted Coalition Formation.
 """
 
 
+import concurrent.futures
+import functools
+import multiprocessing
 import pandas as pd
 from lib.country import Country
 from lib.coalition import Coalition
@@ -19,6 +22,18 @@ from lib.utils import (derive_effectivity,
                        write_latex_tables)
 
 
+@functools.lru_cache(maxsize=8)
+def read_strategy_table(excel_file):
+    """Read (and memoize) a strategy profile excel table.
+
+    Two experiments share power_threshold.xlsx, and parsing the xlsx
+    file is the slowest single step of an experiment, so repeated reads
+    of the same table come from the cache. Callers must copy the
+    returned frame before modifying it.
+    """
+    return pd.read_excel(excel_file, header=[0, 1], index_col=[0, 1, 2])
+
+
 def run_experiment(config):
 
     # 1. Initialize all countries according to the current experiment.
@@ -63,7 +78,9 @@ def run_experiment(config):
     # Then, once the effectivity correspondence is derived from the raw
     # excel input, all missing values are filled with zeros.
     excel_file = config["strategy_table_path"] + config["strategy_table_name"]
-    strategy_df = pd.read_excel(excel_file, header=[0, 1], index_col=[0, 1, 2])
+    # Copy, because the NaN cells are filled in place below and the
+    # cached table must stay pristine.
+    strategy_df = read_strategy_table(excel_file).copy()
 
     effectivity = derive_effectivity(df=strategy_df,
                                      players=config["players"],
@@ -90,9 +107,11 @@ def run_experiment(config):
               transition_probs=P,
               discounting=config["discounting"])
 
-    V = pd.DataFrame(index=config["state_names"], columns=config["players"])
-    for player in config["players"]:
-        V.loc[:, player] = mdp.solve_value_func(payoffs.loc[:, player])
+    # The system matrix is the same for every player, so all value
+    # functions come out of one multi-right-hand-side solve.
+    V = pd.DataFrame(mdp.solve_value_funcs(payoffs.to_numpy()),
+                     index=config["state_names"],
+                     columns=config["players"])
 
     # 6. Return all values calculated for this experiment and
     # pass them to the final check of strategy consistency.
@@ -108,6 +127,19 @@ def run_experiment(config):
     return experiment_results
 
 
+def _run_one(item):
+    """Run and verify a single experiment in a worker process.
+
+    Defined at module level so ProcessPoolExecutor can pickle it. All
+    file writes and reporting stay in the parent process.
+    """
+    experiment, config = item
+    experiment_results = run_experiment(config)
+    success, message = verify_equilibrium(experiment_results)
+
+    return experiment, experiment_results, success, message
+
+
 def main():
     players = ["W", "T", "C"]
     n_players = len(players)
@@ -162,23 +194,40 @@ def main():
         )
     }
 
-    for experiment, experiment_config in experiment_configs.items():
+    items = [(experiment, {**base_config, **experiment_config})
+             for experiment, experiment_config in experiment_configs.items()]
+
+    # The experiments are fully independent of each other, so run them
+    # concurrently in worker processes. The spawn context behaves the
+    # same on all platforms. Finished results are consumed in order as
+    # they arrive, and the .tex exports are handed to a small thread
+    # pool so the file I/O overlaps with the remaining experiments.
+    mp_context = multiprocessing.get_context("spawn")
+    pending_writes = []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as io_pool,\
+         concurrent.futures.ProcessPoolExecutor(
+            max_workers=len(items), mp_context=mp_context) as pool:
+
+        for experiment, experiment_results, success, message\
+                in pool.map(_run_one, items):
 
-        config = {**base_config, **experiment_config}
-        experiment_results = run_experiment(config)
-        success, message = verify_equilibrium(experiment_results)
+            try:
+                assert success
+            except AssertionError:
+                print(message)
 
-        try:
-            assert success
-        except AssertionError:
-            print(message)
+            pending_writes.append(io_pool.submit(
+                write_latex_tables, experiment_results,
+                ["V", "payoffs", "P", "geoengineering"]))
 
-        write_latex_tables(experiment_results,
-                           variables=["V", "payoffs", "P", "geoengineering"])
+            print("Experiment:", experiment)
+            print("Status:", message)
+            print(10 * "-")
 
-        print("Experiment:", experiment)
-        print("Status:", message)
-        print(10 * "-")
+    # Surface any export errors; both pools have drained by now.
+    for write in pending_writes:
+        write.result()
 
 
 if __name__ == "__main__":
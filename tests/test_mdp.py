@@ -17,3 +17,101 @@ def test_solve_value_func():
     V = mdp.solve_value_func(payoffs=payoffs)
 
     assert np.isclose(V, 1234.).all()
+
+
+def test_solve_value_funcs():
+
+    states = ['s1', 's2', 's3']
+    transition_probs = pd.DataFrame([[0.8, 0.1, 0.1],
+                                     [0.2, 0.7, 0.1],
+                                     [0.3, 0.3, 0.4]],
+                                    index=states, columns=states)
+    payoffs_matrix = np.array([[1., -2.],
+                               [3., 0.5],
+                               [-1., 2.]])
+
+    mdp = MDP(n_states=len(states),
+              transition_probs=transition_probs,
+              discounting=0.9)
+
+    V = mdp.solve_value_funcs(payoffs_matrix=payoffs_matrix)
+
+    # Each column of the batched solve must match the corresponding
+    # single-player solve.
+    for i in range(payoffs_matrix.shape[1]):
+        V_single = mdp.solve_value_func(payoffs=payoffs_matrix[:, i])
+        assert np.allclose(V[:, i], V_single)
+
+
+def test_solve_value_func_vi():
+
+    states = ['s1', 's2', 's3']
+    transition_probs = pd.DataFrame([[0.8, 0.1, 0.1],
+                                     [0.2, 0.7, 0.1],
+                                     [0.3, 0.3, 0.4]],
+                                    index=states, columns=states)
+    payoffs = np.array([1., -2., 3.])
+
+    mdp = MDP(n_states=len(states),
+              transition_probs=transition_probs,
+              discounting=0.9)
+
+    V_exact = mdp.solve_value_func(payoffs=payoffs)
+    V_iterated = mdp.solve_value_func_vi(payoffs=payoffs)
+
+    assert np.allclose(V_iterated, V_exact)
+
+
+def test_solve_value_func_avi():
+
+    states = ['s1', 's2', 's3']
+    transition_probs = pd.DataFrame([[0.8, 0.1, 0.1],
+                                     [0.2, 0.7, 0.1],
+                                     [0.3, 0.3, 0.4]],
+                                    index=states, columns=states)
+    payoffs = np.array([1., -2., 3.])
+
+    mdp = MDP(n_states=len(states),
+              transition_probs=transition_probs,
+              discounting=0.99)
+
+    V_exact = mdp.solve_value_func(payoffs=payoffs)
+    V_accelerated = mdp.solve_value_func_avi(payoffs=payoffs)
+
+    assert np.allclose(V_accelerated, V_exact)
+
+
+def test_solve_value_func_avi_cyclic_transitions():
+
+    # A cyclic permutation matrix is a valid stochastic matrix on which
+    # the unsafeguarded momentum extrapolation diverges; the safeguard
+    # must still reach the exact fixed point.
+    states = ['s1', 's2', 's3', 's4', 's5']
+    transition_probs = pd.DataFrame(np.roll(np.eye(len(states)), 1, axis=1),
+                                    index=states, columns=states)
+    payoffs = np.array([1., -2., 3., 0.5, -1.])
+
+    mdp = MDP(n_states=len(states),
+              transition_probs=transition_probs,
+              discounting=0.9)
+
+    V_exact = mdp.solve_value_func(payoffs=payoffs)
+    V_accelerated = mdp.solve_value_func_avi(payoffs=payoffs)
+
+    assert np.allclose(V_accelerated, V_exact)
+
+
+def test_solve_value_func_vi_without_discounting():
+
+    states = ['s1', 's2', 's3']
+    transition_probs = pd.DataFrame(np.eye(len(states)), index=states,
+                                    columns=states)
+    payoffs = np.array([1., -2., 3.])
+
+    mdp = MDP(n_states=len(states),
+              transition_probs=transition_probs,
+              discounting=0.)
+
+    V = mdp.solve_value_func_vi(payoffs=payoffs)
+
+    assert np.allclose(V, payoffs)